@@ -1,8 +1,26 @@
+import hashlib
+import inspect
+import os
+from functools import lru_cache, wraps
+
 import dash
-from dash import dcc, html, Input, Output
+from dash import dash_table, dcc, html, Input, Output
+from dash.dash_table.Format import Format, Scheme, Trim
+import joblib
+from joblib import Parallel, delayed
 import plotly.figure_factory as ff
 import plotly.graph_objects as go
 import numpy as np
+import pandas as pd
+from scipy.cluster.hierarchy import leaves_list, linkage
+from scipy.spatial.distance import squareform
+from sklearn.decomposition import IncrementalPCA
+from sklearn.ensemble import IsolationForest, RandomForestClassifier
+from sklearn.manifold import TSNE
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
 
 # === Datos ===
 # Random Forest
@@ -41,8 +59,381 @@ top_tree_features = [
 ]
 top_tree_importances = [0.35, 0.25, 0.15, 0.10, 0.08, 0.07]
 
+# === Datos Starcraft ===
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(BASE_DIR, 'Starcraft 2.csv')
+CACHE_DIR = os.path.join(BASE_DIR, 'cache')
+
+TARGET = 'LeagueIndex'
+FEATURES = [
+    'Age', 'HoursPerWeek', 'TotalHours', 'APM', 'SelectByHotkeys',
+    'AssignToHotkeys', 'MinimapAttacks', 'MinimapRightClicks', 'NumberOfPACs',
+    'GapBetweenPACs', 'ActionLatency', 'ActionsInPAC', 'TotalMapExplored',
+    'WorkersMade', 'UniqueUnitsMade', 'ComplexUnitsMade', 'ComplexAbilityUsed',
+    'MaxTimeStamp'
+]
+LEAGUE_NAMES = {
+    1: 'Bronce', 2: 'Plata', 3: 'Oro', 4: 'Platino',
+    5: 'Diamante', 6: 'Maestro', 7: 'Gran Maestro', 8: 'Profesional'
+}
+LEAGUE_COLORS = {
+    1: '#cd7f32', 2: '#c0c0c0', 3: '#facc15', 4: '#4cc9f0',
+    5: '#a5b4fc', 6: '#4ade80', 7: '#f472b6', 8: '#f87171'
+}
+
+# Los modelos de las pestañas de Starcraft se entrenan aquí sobre LeagueIndex y no
+# tienen relación con los modelos de lluvia de las pestañas Random Forest/Árbol.
+STARCRAFT_MODELS_NOTE = (
+    "Random Forest y Árbol de Decisión entrenados sobre Starcraft 2 para predecir la liga; "
+    "son modelos distintos de los de lluvia de las primeras pestañas."
+)
+
+CHUNK_SIZE = 50_000        # filas por lote al recorrer el CSV
+MAX_TRAIN_ROWS = 200_000   # tamaño máximo de la muestra de entrenamiento
+MAX_POINTS = 5_000         # puntos que se envían al navegador
+PCA_COMPONENTS = 10
+PD_GRID_POINTS = 20        # valores evaluados por variable en dependencia parcial
+PD_ICE_ROWS = 200          # jugadores de referencia para las curvas ICE
+PD_TOP_FEATURES = 6        # variables precalculadas al construir los artefactos
+CORR_RANK_SAMPLE = 100_000 # filas de referencia para los rangos de Spearman
+OUTLIER_FIT_ROWS = 100_000 # muestra usada para ajustar el IsolationForest
+OUTLIER_CONTAMINATION = 0.02
+OUTLIER_TOP = 20           # peores jugadores mostrados en el panel
+ARTIFACT_SCHEMA = 2        # incrementar al cambiar cómo se calcula algún artefacto
+
+
+@lru_cache(maxsize=8)
+def _file_hash(path, size, mtime_ns):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def data_version(path=DATA_PATH):
+    stat = os.stat(path)
+    return _file_hash(path, stat.st_size, stat.st_mtime_ns)
+
+
+def iter_chunks(path=DATA_PATH):
+    yield from pd.read_csv(path, chunksize=CHUNK_SIZE)
+
+
+def settings_version():
+    # Huella del esquema y de los parámetros que afectan a los artefactos
+    settings = repr((
+        ARTIFACT_SCHEMA, TARGET, FEATURES, MAX_TRAIN_ROWS, MAX_POINTS,
+        PCA_COMPONENTS, PD_GRID_POINTS, PD_ICE_ROWS, PD_TOP_FEATURES,
+        CORR_RANK_SAMPLE, OUTLIER_FIT_ROWS, OUTLIER_CONTAMINATION, OUTLIER_TOP
+    ))
+    return hashlib.sha1(settings.encode()).hexdigest()[:8]
+
+
+def cached(name):
+    # Guarda el resultado en memoria y en disco (cache/<versión datos>/<versión
+    # parámetros>/), de modo que solo se recalcula cuando cambia el contenido
+    # del CSV, el esquema de artefactos o algún parámetro.
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @lru_cache(maxsize=32)
+        def memo(version, *args):
+            filename = '_'.join([name, *map(str, args)]) + '.joblib'
+            path = os.path.join(CACHE_DIR, version, settings_version(), filename)
+            if os.path.exists(path):
+                return joblib.load(path)
+            result = func(version, *args)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            joblib.dump(result, tmp_path)
+            os.replace(tmp_path, path)
+            return result
+
+        @wraps(func)
+        def wrapper(*args, version=None):
+            # Se completan los valores por defecto para que f() y f(False)
+            # compartan la misma entrada de caché
+            bound = signature.bind(version or data_version(), *args)
+            bound.apply_defaults()
+            return memo(*bound.args)
+        return wrapper
+    return decorator
+
+
+def impute(X, stats):
+    X = np.asarray(X, dtype=float)
+    return np.where(np.isnan(X), stats['scaler'].mean_, X)
+
+
+def standardize(X, stats):
+    return stats['scaler'].transform(impute(X, stats))
+
+
+@cached('stats')
+def dataset_stats(version):
+    scaler = StandardScaler()
+    n_rows = 0
+    for chunk in iter_chunks():
+        scaler.partial_fit(chunk[FEATURES].to_numpy(dtype=float))
+        n_rows += len(chunk)
+    return {'n_rows': n_rows, 'scaler': scaler}
+
+
+def read_rows(positions):
+    # Lee solo las filas indicadas (posición global en el CSV), por lotes
+    positions = np.sort(np.asarray(positions))
+    parts = []
+    offset = 0
+    for chunk in iter_chunks():
+        rows = positions[(positions >= offset) & (positions < offset + len(chunk))] - offset
+        offset += len(chunk)
+        if len(rows):
+            parts.append(chunk.iloc[rows])
+    return pd.concat(parts)
+
+
+def sample_rows(n_rows, size, seed=0):
+    rng = np.random.RandomState(seed)
+    return read_rows(rng.choice(n_rows, size=min(n_rows, size), replace=False))
+
+
+@cached('models')
+def trained_models(version, exclude_outliers=False):
+    stats = dataset_stats(version=version)
+    sample = sample_rows(stats['n_rows'], MAX_TRAIN_ROWS)
+    train, test = train_test_split(sample, test_size=0.25, random_state=42)
+    if exclude_outliers:
+        # Solo se filtra el entrenamiento: la evaluación usa el mismo conjunto de prueba
+        flagged = outlier_scores(version=version)['flagged']
+        train = train[~flagged[train.index]]
+    X_train = impute(train[FEATURES].to_numpy(dtype=float), stats)
+    X_test = impute(test[FEATURES].to_numpy(dtype=float), stats)
+    y_train = train[TARGET].to_numpy()
+    y_test = test[TARGET].to_numpy()
+
+    rf = RandomForestClassifier(n_estimators=100, n_jobs=-1, random_state=42)
+    tree = DecisionTreeClassifier(max_depth=8, random_state=42)
+    metrics = {}
+    for key, model in (('rf', rf), ('tree', tree)):
+        model.fit(X_train, y_train)
+        y_pred = model.predict(X_test)
+        metrics[key] = {
+            'accuracy': accuracy_score(y_test, y_pred),
+            'f1_macro': f1_score(y_test, y_pred, average='macro')
+        }
+    return {
+        'rf': rf,
+        'tree': tree,
+        'metrics': metrics,
+        'n_train': len(train),
+        'train_rows': train.index.to_numpy()
+    }
+
+
+@cached('pca')
+def fitted_pca(version):
+    stats = dataset_stats(version=version)
+    ipca = IncrementalPCA(n_components=PCA_COMPONENTS)
+    for chunk in iter_chunks():
+        # IncrementalPCA necesita al menos n_components filas por lote
+        if len(chunk) >= PCA_COMPONENTS:
+            ipca.partial_fit(standardize(chunk[FEATURES].to_numpy(dtype=float), stats))
+    return ipca
+
+
+def project_rows(df, version=None):
+    # Proyecta filas nuevas con los componentes guardados, sin reajustar el PCA
+    version = version or data_version()
+    stats = dataset_stats(version=version)
+    ipca = fitted_pca(version=version)
+    return ipca.transform(standardize(df[FEATURES].to_numpy(dtype=float), stats))
+
+
+@cached('projection')
+def embedding_projection(version):
+    stats = dataset_stats(version=version)
+    models = trained_models(version=version)
+    # Solo jugadores no usados en el entrenamiento, para que las predicciones
+    # sean fuera de muestra y muestren dónde se confunden realmente los modelos
+    eligible = np.setdiff1d(np.arange(stats['n_rows']), models['train_rows'])
+    rng = np.random.RandomState(1)
+    sample = read_rows(rng.choice(eligible, size=min(len(eligible), MAX_POINTS), replace=False))
+    X = impute(sample[FEATURES].to_numpy(dtype=float), stats)
+    return {
+        'coords': project_rows(sample, version=version).astype(np.float32),
+        'explained': fitted_pca(version=version).explained_variance_ratio_,
+        'game_id': sample['GameID'].to_numpy(),
+        'league': sample[TARGET].to_numpy(),
+        'rf': models['rf'].predict(X),
+        'tree': models['tree'].predict(X),
+        'n_rows': stats['n_rows'],
+        'n_eligible': len(eligible)
+    }
+
+
+@cached('tsne')
+def tsne_projection(version):
+    # Refinamiento opcional: t-SNE sobre los componentes PCA de la muestra
+    coords = embedding_projection(version=version)['coords']
+    return TSNE(n_components=2, init='pca', random_state=0).fit_transform(coords).astype(np.float32)
+
+
+def ranked_features(model_key, version=None):
+    model = trained_models(version=version)[model_key]
+    order = np.argsort(model.feature_importances_)[::-1]
+    return [FEATURES[i] for i in order]
+
+
+@cached('pd_background')
+def pd_background(version):
+    stats = dataset_stats(version=version)
+    sample = sample_rows(stats['n_rows'], PD_ICE_ROWS, seed=2)
+    return impute(sample[FEATURES].to_numpy(dtype=float), stats)
+
+
+def compute_partial_dependence(model, X, feature):
+    idx = FEATURES.index(feature)
+    # Rejilla entre percentiles 5 y 95 para que los valores extremos no la dominen
+    grid = np.unique(np.quantile(X[:, idx], np.linspace(0.05, 0.95, PD_GRID_POINTS)))
+
+    # Un único lote de (filas × puntos de rejilla) evaluado con una sola llamada
+    stacked = np.repeat(X, len(grid), axis=0)
+    stacked[:, idx] = np.tile(grid, len(X))
+    expected = model.predict_proba(stacked) @ model.classes_
+    ice = expected.reshape(len(X), len(grid))
+    return {'grid': grid, 'ice': ice, 'pd': ice.mean(axis=0)}
+
+
+@cached('pd')
+def partial_dependence(version, model_key, feature):
+    model = trained_models(version=version)[model_key]
+    return compute_partial_dependence(model, pd_background(version=version), feature)
+
+
+@cached('pd_top')
+def top_partial_dependence(version, model_key):
+    model = trained_models(version=version)[model_key]
+    X = pd_background(version=version)
+    features = ranked_features(model_key, version=version)[:PD_TOP_FEATURES]
+    results = Parallel(n_jobs=-1, prefer='threads')(
+        delayed(compute_partial_dependence)(model, X, feature) for feature in features
+    )
+    return dict(zip(features, results))
+
+
+def get_partial_dependence(model_key, feature):
+    version = data_version()
+    top = top_partial_dependence(model_key, version=version)
+    if feature in top:
+        return top[feature]
+    return partial_dependence(model_key, feature, version=version)
+
+
+def _accumulate_moments(acc, Z):
+    # Sumas y productos cruzados por pares de columnas, ignorando los NaN
+    valid = ~np.isnan(Z)
+    Z0 = np.where(valid, Z, 0.0)
+    M = valid.astype(float)
+    acc['n'] += M.T @ M
+    acc['s'] += Z0.T @ M
+    acc['ss'] += (Z0 ** 2).T @ M
+    acc['xy'] += Z0.T @ Z0
+
+
+def _correlation_from_moments(acc):
+    n, s, ss, xy = acc['n'], acc['s'], acc['ss'], acc['xy']
+    cov = n * xy - s * s.T
+    var = n * ss - s ** 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = cov / np.sqrt(var * var.T)
+    np.fill_diagonal(corr, 1.0)
+    return np.nan_to_num(corr)
+
+
+def _rank_columns(X, reference):
+    # Rango medio aproximado de cada valor respecto a una muestra ordenada. Se
+    # calcula por columna sobre todos sus valores no nulos, no sobre las filas
+    # completas de cada par, así que con valores faltantes no coincide
+    # exactamente con df.corr('spearman') aunque la muestra cubra todo el CSV.
+    ranks = np.full(X.shape, np.nan)
+    for j, ref in enumerate(reference):
+        valid = ~np.isnan(X[:, j])
+        x = X[valid, j]
+        ranks[valid, j] = (np.searchsorted(ref, x, 'left') + np.searchsorted(ref, x, 'right')) / 2
+    return ranks
+
+
+@cached('correlation')
+def feature_correlation(version):
+    stats = dataset_stats(version=version)
+    sample = sample_rows(stats['n_rows'], CORR_RANK_SAMPLE, seed=3)[FEATURES].to_numpy(dtype=float)
+    reference = [np.sort(col[~np.isnan(col)]) for col in sample.T]
+
+    k = len(FEATURES)
+    accs = {
+        method: {key: np.zeros((k, k)) for key in ('n', 's', 'ss', 'xy')}
+        for method in ('pearson', 'spearman')
+    }
+    for chunk in iter_chunks():
+        X = chunk[FEATURES].to_numpy(dtype=float)
+        # Centrar y escalar antes de acumular evita perder precisión en las sumas
+        _accumulate_moments(accs['pearson'], stats['scaler'].transform(X))
+        _accumulate_moments(accs['spearman'], _rank_columns(X, reference))
+
+    result = {}
+    for method, acc in accs.items():
+        corr = _correlation_from_moments(acc)
+        distance = np.clip(1 - np.abs(corr), 0, None)
+        np.fill_diagonal(distance, 0)
+        order = leaves_list(linkage(squareform(distance, checks=False), method='average'))
+        result[method] = {'corr': corr, 'order': order}
+    return result
+
+
+@cached('outliers')
+def outlier_scores(version):
+    stats = dataset_stats(version=version)
+    sample = sample_rows(stats['n_rows'], OUTLIER_FIT_ROWS, seed=4)
+    forest = IsolationForest(
+        n_estimators=200, contamination=OUTLIER_CONTAMINATION, random_state=42
+    ).fit(impute(sample[FEATURES].to_numpy(dtype=float), stats))
+
+    # Puntuación por lotes de tamaño fijo repartidos entre los hilos de trabajo;
+    # valores negativos indican filas atípicas
+    scores = np.concatenate(Parallel(n_jobs=-1, prefer='threads')(
+        delayed(forest.decision_function)(impute(chunk[FEATURES].to_numpy(dtype=float), stats))
+        for chunk in iter_chunks()
+    )).astype(np.float32)
+
+    worst = read_rows(np.argsort(scores)[:OUTLIER_TOP])
+    worst.insert(0, 'Puntuación', scores[worst.index])
+    return {
+        'scores': scores,
+        'flagged': scores < 0,
+        'worst': worst.sort_values('Puntuación')
+    }
+
+
+def build_artifacts():
+    version = data_version()
+    dataset_stats(version=version)
+    trained_models(version=version)
+    embedding_projection(version=version)
+    tsne_projection(version=version)
+    for model_key in ('rf', 'tree'):
+        top_partial_dependence(model_key, version=version)
+    feature_correlation(version=version)
+    outlier_scores(version=version)
+    trained_models(True, version=version)
+
+
+# Se construye al importar para que ninguna pestaña calcule dentro de una petición;
+# con `gunicorn --preload` lo hace una sola vez el proceso maestro.
+build_artifacts()
+
 # === App ===
-app = dash.Dash(__name__)
+app = dash.Dash(__name__, suppress_callback_exceptions=True)
 server = app.server
 
 # Paleta de colores oscura
@@ -162,6 +553,66 @@ app.layout = html.Div(style={
                     'color': colors['background'],
                     'border': f'1px solid {colors["highlight"]}'
                 }
+            ),
+            dcc.Tab(
+                label='Dependencia Parcial',
+                value='tab-dependence',
+                style={
+                    'fontWeight': 'bold',
+                    'padding': '12px',
+                    'border': f'1px solid {colors["border"]}',
+                    'backgroundColor': colors['card_bg']
+                },
+                selected_style={
+                    'backgroundColor': colors['primary'],
+                    'color': colors['background'],
+                    'border': f'1px solid {colors["primary"]}'
+                }
+            ),
+            dcc.Tab(
+                label='Correlaciones',
+                value='tab-correlation',
+                style={
+                    'fontWeight': 'bold',
+                    'padding': '12px',
+                    'border': f'1px solid {colors["border"]}',
+                    'backgroundColor': colors['card_bg']
+                },
+                selected_style={
+                    'backgroundColor': colors['highlight'],
+                    'color': colors['background'],
+                    'border': f'1px solid {colors["highlight"]}'
+                }
+            ),
+            dcc.Tab(
+                label='Valores Atípicos',
+                value='tab-outliers',
+                style={
+                    'fontWeight': 'bold',
+                    'padding': '12px',
+                    'border': f'1px solid {colors["border"]}',
+                    'backgroundColor': colors['card_bg']
+                },
+                selected_style={
+                    'backgroundColor': colors['danger'],
+                    'color': colors['background'],
+                    'border': f'1px solid {colors["danger"]}'
+                }
+            ),
+            dcc.Tab(
+                label='Proyección 2D',
+                value='tab-projection',
+                style={
+                    'fontWeight': 'bold',
+                    'padding': '12px',
+                    'border': f'1px solid {colors["border"]}',
+                    'backgroundColor': colors['card_bg']
+                },
+                selected_style={
+                    'backgroundColor': colors['secondary'],
+                    'color': colors['background'],
+                    'border': f'1px solid {colors["secondary"]}'
+                }
             )
         ],
         colors={
@@ -204,6 +655,125 @@ def create_metric_card(title, value, color, tooltip=None):
         })
     ])
 
+def create_projection_figure(method, color_by):
+    projection = embedding_projection()
+    if method == 'tsne':
+        xy = tsne_projection()
+        axis_titles = ('t-SNE 1', 't-SNE 2')
+    else:
+        xy = projection['coords'][:, :2]
+        axis_titles = tuple(
+            f"PC{i + 1} ({ratio*100:.1f}% var.)"
+            for i, ratio in enumerate(projection['explained'][:2])
+        )
+
+    league = projection['league']
+    values = projection[color_by]
+    # En modo predicción, las cruces marcan jugadores con liga mal clasificada
+    errors = (values != league) if color_by != 'league' else np.zeros(len(league), dtype=bool)
+
+    fig = go.Figure()
+    for code, name in LEAGUE_NAMES.items():
+        mask = values == code
+        if not mask.any():
+            continue
+        fig.add_trace(go.Scattergl(
+            x=xy[mask, 0],
+            y=xy[mask, 1],
+            mode='markers',
+            name=name,
+            marker={
+                'color': LEAGUE_COLORS[code],
+                'size': 6,
+                'opacity': 0.75,
+                'symbol': np.where(errors[mask], 'x', 'circle')
+            },
+            customdata=np.column_stack([
+                projection['game_id'][mask],
+                [LEAGUE_NAMES[v] for v in league[mask]],
+                [LEAGUE_NAMES[v] for v in projection['rf'][mask]],
+                [LEAGUE_NAMES[v] for v in projection['tree'][mask]]
+            ]),
+            hovertemplate=(
+                '<b>GameID %{customdata[0]}</b><br>'
+                'Liga real: %{customdata[1]}<br>'
+                'Random Forest (Starcraft): %{customdata[2]}<br>'
+                'Árbol (Starcraft): %{customdata[3]}<extra></extra>'
+            )
+        ))
+    return fig.update_layout(
+        plot_bgcolor=colors['card_bg'],
+        paper_bgcolor=colors['card_bg'],
+        font={'color': colors['text']},
+        xaxis_title=axis_titles[0],
+        yaxis_title=axis_titles[1],
+        legend_title='Liga',
+        height=600,
+        margin={'t': 40}
+    )
+
+def create_dependence_figure(model_key, feature, show_ice):
+    result = get_partial_dependence(model_key, feature)
+    color = colors['primary'] if model_key == 'rf' else colors['success']
+    grid = result['grid']
+
+    fig = go.Figure()
+    if show_ice:
+        # Todas las curvas ICE en una sola traza, separadas por None
+        n_rows = len(result['ice'])
+        x = np.append(grid, None)
+        fig.add_trace(go.Scattergl(
+            x=np.tile(x, n_rows),
+            y=np.column_stack([result['ice'], np.full(n_rows, None)]).ravel(),
+            mode='lines',
+            name='ICE (jugador individual)',
+            line={'color': colors['secondary'], 'width': 1},
+            opacity=0.25,
+            hoverinfo='skip'
+        ))
+    fig.add_trace(go.Scatter(
+        x=grid,
+        y=result['pd'],
+        mode='lines+markers',
+        name='Dependencia parcial (media)',
+        line={'color': color, 'width': 4},
+        hovertemplate=f'{feature}: %{{x:,.4g}}<br>Liga esperada: %{{y:.2f}}<extra></extra>'
+    ))
+    return fig.update_layout(
+        plot_bgcolor=colors['card_bg'],
+        paper_bgcolor=colors['card_bg'],
+        font={'color': colors['text']},
+        xaxis_title=feature,
+        yaxis_title='Liga esperada',
+        height=550,
+        margin={'t': 40}
+    )
+
+def create_correlation_figure(method, clustered):
+    result = feature_correlation()[method]
+    order = result['order'] if clustered else np.arange(len(FEATURES))
+    corr = result['corr'][np.ix_(order, order)]
+    labels = [FEATURES[i] for i in order]
+    return ff.create_annotated_heatmap(
+        z=corr,
+        x=labels,
+        y=labels,
+        colorscale='RdBu',
+        zmin=-1,
+        zmax=1,
+        showscale=True,
+        hoverinfo='z',
+        annotation_text=[[f"{val:.2f}" for val in row] for row in corr],
+        font_colors=['white']
+    ).update_layout(
+        plot_bgcolor=colors['card_bg'],
+        paper_bgcolor=colors['card_bg'],
+        font={'color': colors['text']},
+        yaxis={'autorange': 'reversed'},
+        height=750,
+        margin={'t': 120, 'l': 150}
+    )
+
 @app.callback(
     Output('tabs-content', 'children'),
     Input('tabs', 'value'),
@@ -736,7 +1306,387 @@ def render_content(tab):
         
         return compare_content
 
+    elif tab == 'tab-dependence':
+        return html.Div([
+            html.Div(style={
+                'backgroundColor': colors['card_bg'],
+                'padding': '25px',
+                'borderRadius': '10px',
+                'marginBottom': '25px',
+                'border': f'1px solid {colors["border"]}',
+                'boxShadow': '0 2px 8px rgba(0,0,0,0.2)'
+            }, children=[
+                html.H3("Dependencia Parcial e ICE", style={
+                    'color': colors['primary'],
+                    'marginTop': '0',
+                    'borderBottom': f'1px solid {colors["border"]}',
+                    'paddingBottom': '12px'
+                }),
+                html.P("Cómo cambia la liga esperada al variar una sola variable, manteniendo el resto de cada jugador. "
+                       "La línea gruesa es la media; las finas, jugadores individuales.",
+                       style={'color': colors['secondary']}),
+                html.Small(STARCRAFT_MODELS_NOTE, style={'color': colors['secondary']})
+            ]),
+
+            html.Div(style={
+                'backgroundColor': colors['card_bg'],
+                'padding': '25px',
+                'borderRadius': '10px',
+                'border': f'1px solid {colors["border"]}',
+                'boxShadow': '0 2px 8px rgba(0,0,0,0.2)'
+            }, children=[
+                html.Div(style={
+                    'display': 'flex',
+                    'flexWrap': 'wrap',
+                    'gap': '40px',
+                    'marginBottom': '15px'
+                }, children=[
+                    html.Div([
+                        html.H5("Modelo", style={'color': colors['secondary'], 'marginTop': '0'}),
+                        dcc.RadioItems(
+                            id='dependence-model',
+                            options=[
+                                {'label': 'Random Forest (Starcraft)', 'value': 'rf'},
+                                {'label': 'Árbol de Decisión (Starcraft)', 'value': 'tree'}
+                            ],
+                            value='rf',
+                            labelStyle={'marginRight': '15px'}
+                        )
+                    ]),
+                    html.Div(style={'minWidth': '250px'}, children=[
+                        html.H5("Variable", style={'color': colors['secondary'], 'marginTop': '0'}),
+                        dcc.Dropdown(
+                            id='dependence-feature',
+                            options=[{'label': f, 'value': f} for f in ranked_features('rf')],
+                            value=ranked_features('rf')[0],
+                            clearable=False,
+                            style={'color': colors['background']}
+                        )
+                    ]),
+                    html.Div([
+                        html.H5("Curvas", style={'color': colors['secondary'], 'marginTop': '0'}),
+                        dcc.Checklist(
+                            id='dependence-ice',
+                            options=[{'label': 'Mostrar ICE', 'value': 'ice'}],
+                            value=['ice']
+                        )
+                    ])
+                ]),
+                dcc.Loading(dcc.Graph(id='dependence-graph'))
+            ])
+        ])
+
+    elif tab == 'tab-correlation':
+        return html.Div([
+            html.Div(style={
+                'backgroundColor': colors['card_bg'],
+                'padding': '25px',
+                'borderRadius': '10px',
+                'marginBottom': '25px',
+                'border': f'1px solid {colors["border"]}',
+                'boxShadow': '0 2px 8px rgba(0,0,0,0.2)'
+            }, children=[
+                html.H3("Relaciones entre Variables", style={
+                    'color': colors['highlight'],
+                    'marginTop': '0',
+                    'borderBottom': f'1px solid {colors["border"]}',
+                    'paddingBottom': '12px'
+                }),
+                html.P("Correlación entre las variables de los jugadores. El agrupamiento jerárquico "
+                       "coloca juntas las variables que se mueven de forma parecida.",
+                       style={'color': colors['secondary']})
+            ]),
+
+            html.Div(style={
+                'backgroundColor': colors['card_bg'],
+                'padding': '25px',
+                'borderRadius': '10px',
+                'border': f'1px solid {colors["border"]}',
+                'boxShadow': '0 2px 8px rgba(0,0,0,0.2)'
+            }, children=[
+                html.Div(style={
+                    'display': 'flex',
+                    'flexWrap': 'wrap',
+                    'gap': '40px',
+                    'marginBottom': '15px'
+                }, children=[
+                    html.Div([
+                        html.H5("Coeficiente", style={'color': colors['secondary'], 'marginTop': '0'}),
+                        dcc.RadioItems(
+                            id='correlation-method',
+                            options=[
+                                {'label': 'Pearson', 'value': 'pearson'},
+                                {'label': 'Spearman', 'value': 'spearman'}
+                            ],
+                            value='pearson',
+                            labelStyle={'marginRight': '15px'}
+                        )
+                    ]),
+                    html.Div([
+                        html.H5("Orden", style={'color': colors['secondary'], 'marginTop': '0'}),
+                        dcc.Checklist(
+                            id='correlation-clustered',
+                            options=[{'label': 'Agrupamiento jerárquico', 'value': 'clustered'}],
+                            value=['clustered']
+                        )
+                    ])
+                ]),
+                dcc.Loading(dcc.Graph(id='correlation-graph'))
+            ])
+        ])
+
+    elif tab == 'tab-outliers':
+        outliers = outlier_scores()
+        with_outliers = trained_models()
+        without_outliers = trained_models(True)
+        n_flagged = int(outliers['flagged'].sum())
+        worst = outliers['worst']
+        return html.Div([
+            html.Div(style={
+                'backgroundColor': colors['card_bg'],
+                'padding': '25px',
+                'borderRadius': '10px',
+                'marginBottom': '25px',
+                'border': f'1px solid {colors["border"]}',
+                'boxShadow': '0 2px 8px rgba(0,0,0,0.2)'
+            }, children=[
+                html.H3("Detección de Valores Atípicos", style={
+                    'color': colors['danger'],
+                    'marginTop': '0',
+                    'borderBottom': f'1px solid {colors["border"]}',
+                    'paddingBottom': '12px'
+                }),
+                html.P("Un Isolation Forest puntúa cada jugador; los valores negativos indican registros "
+                       "implausibles que pueden sesgar los modelos.",
+                       style={'color': colors['secondary']}),
+                html.Small(STARCRAFT_MODELS_NOTE, style={'color': colors['secondary']})
+            ]),
+
+            html.Div(style={
+                'display': 'flex',
+                'justifyContent': 'space-around',
+                'flexWrap': 'wrap',
+                'marginBottom': '25px'
+            }, children=[
+                create_metric_card(
+                    "Jugadores marcados",
+                    f"{n_flagged:,}",
+                    colors['danger'],
+                    f"De {len(outliers['scores']):,} registros"
+                ),
+                create_metric_card(
+                    "Entrenamiento sin atípicos",
+                    f"{without_outliers['n_train']:,}",
+                    colors['secondary'],
+                    f"Filas de entrenamiento; con atípicos: {with_outliers['n_train']:,}"
+                ),
+                create_metric_card(
+                    "Exactitud RF sin atípicos",
+                    f"{without_outliers['metrics']['rf']['accuracy']*100:.1f}%",
+                    colors['primary'],
+                    f"Con atípicos: {with_outliers['metrics']['rf']['accuracy']*100:.1f}%"
+                ),
+                create_metric_card(
+                    "Exactitud Árbol sin atípicos",
+                    f"{without_outliers['metrics']['tree']['accuracy']*100:.1f}%",
+                    colors['success'],
+                    f"Con atípicos: {with_outliers['metrics']['tree']['accuracy']*100:.1f}%"
+                )
+            ]),
+
+            html.Div(style={
+                'backgroundColor': colors['card_bg'],
+                'padding': '25px',
+                'borderRadius': '10px',
+                'marginBottom': '25px',
+                'border': f'1px solid {colors["border"]}',
+                'boxShadow': '0 2px 8px rgba(0,0,0,0.2)'
+            }, children=[
+                html.H4("Impacto en los Modelos", style={
+                    'color': colors['danger'],
+                    'marginTop': '0'
+                }),
+                dcc.Graph(
+                    figure=go.Figure(
+                        data=[
+                            go.Bar(
+                                name=label,
+                                x=['RF Exactitud', 'RF F1 macro', 'Árbol Exactitud', 'Árbol F1 macro'],
+                                y=[
+                                    result['metrics']['rf']['accuracy'],
+                                    result['metrics']['rf']['f1_macro'],
+                                    result['metrics']['tree']['accuracy'],
+                                    result['metrics']['tree']['f1_macro']
+                                ],
+                                marker_color=color,
+                                hovertemplate='%{x}: %{y:.1%}<extra></extra>'
+                            )
+                            for label, result, color in (
+                                ('Con atípicos', with_outliers, colors['secondary']),
+                                ('Sin atípicos', without_outliers, colors['danger'])
+                            )
+                        ],
+                        layout=go.Layout(
+                            barmode='group',
+                            plot_bgcolor=colors['card_bg'],
+                            paper_bgcolor=colors['card_bg'],
+                            font={'color': colors['text']},
+                            yaxis={'tickformat': ',.0%', 'range': [0, 1]},
+                            margin={'t': 40}
+                        )
+                    )
+                )
+            ]),
+
+            html.Div(style={
+                'backgroundColor': colors['card_bg'],
+                'padding': '25px',
+                'borderRadius': '10px',
+                'border': f'1px solid {colors["border"]}',
+                'boxShadow': '0 2px 8px rgba(0,0,0,0.2)'
+            }, children=[
+                html.H4(f"Los {len(worst)} Jugadores más Atípicos", style={
+                    'color': colors['danger'],
+                    'marginTop': '0'
+                }),
+                dash_table.DataTable(
+                    data=worst.to_dict('records'),
+                    # Se formatea al mostrar, sin redondear los datos: cifras
+                    # significativas para no perder columnas de escala muy pequeña
+                    columns=[
+                        {
+                            'name': c,
+                            'id': c,
+                            'type': 'numeric',
+                            'format': Format(precision=4, scheme=Scheme.fixed) if c == 'Puntuación'
+                            else Format(precision=8, scheme=Scheme.decimal_or_exponent, trim=Trim.yes)
+                        }
+                        for c in worst.columns
+                    ],
+                    style_table={'overflowX': 'auto'},
+                    style_header={
+                        'backgroundColor': colors['header_bg'],
+                        'color': colors['text'],
+                        'fontWeight': 'bold',
+                        'border': f'1px solid {colors["border"]}'
+                    },
+                    style_cell={
+                        'backgroundColor': colors['card_bg'],
+                        'color': colors['text'],
+                        'border': f'1px solid {colors["border"]}',
+                        'padding': '6px'
+                    }
+                )
+            ])
+        ])
+
+    elif tab == 'tab-projection':
+        projection = embedding_projection()
+        return html.Div([
+            html.Div(style={
+                'backgroundColor': colors['card_bg'],
+                'padding': '25px',
+                'borderRadius': '10px',
+                'marginBottom': '25px',
+                'border': f'1px solid {colors["border"]}',
+                'boxShadow': '0 2px 8px rgba(0,0,0,0.2)'
+            }, children=[
+                html.H3("Proyección 2D de Jugadores", style={
+                    'color': colors['secondary'],
+                    'marginTop': '0',
+                    'borderBottom': f'1px solid {colors["border"]}',
+                    'paddingBottom': '12px'
+                }),
+                html.P("Jugadores de Starcraft 2 proyectados con PCA incremental. "
+                       "Al colorear por predicción, las cruces señalan las ligas que el modelo confunde. "
+                       "Solo se muestran jugadores excluidos del entrenamiento, así que las predicciones "
+                       "son fuera de muestra.",
+                       style={'color': colors['secondary']}),
+                html.P(f"Mostrando {len(projection['league']):,} de {projection['n_eligible']:,} jugadores "
+                       f"no usados en el entrenamiento ({projection['n_rows']:,} en total)",
+                       style={'color': colors['secondary'], 'fontSize': '14px'}),
+                html.Small(STARCRAFT_MODELS_NOTE, style={'color': colors['secondary']})
+            ]),
+
+            html.Div(style={
+                'backgroundColor': colors['card_bg'],
+                'padding': '25px',
+                'borderRadius': '10px',
+                'border': f'1px solid {colors["border"]}',
+                'boxShadow': '0 2px 8px rgba(0,0,0,0.2)'
+            }, children=[
+                html.Div(style={
+                    'display': 'flex',
+                    'flexWrap': 'wrap',
+                    'gap': '40px',
+                    'marginBottom': '15px'
+                }, children=[
+                    html.Div([
+                        html.H5("Método", style={'color': colors['secondary'], 'marginTop': '0'}),
+                        dcc.RadioItems(
+                            id='projection-method',
+                            options=[
+                                {'label': 'PCA', 'value': 'pca'},
+                                {'label': 'PCA + t-SNE', 'value': 'tsne'}
+                            ],
+                            value='pca',
+                            labelStyle={'marginRight': '15px'}
+                        )
+                    ]),
+                    html.Div([
+                        html.H5("Colorear por", style={'color': colors['secondary'], 'marginTop': '0'}),
+                        dcc.RadioItems(
+                            id='projection-color',
+                            options=[
+                                {'label': 'Liga real', 'value': 'league'},
+                                {'label': 'Predicción Random Forest (Starcraft)', 'value': 'rf'},
+                                {'label': 'Predicción Árbol (Starcraft)', 'value': 'tree'}
+                            ],
+                            value='league',
+                            labelStyle={'marginRight': '15px'}
+                        )
+                    ])
+                ]),
+                dcc.Loading(dcc.Graph(id='projection-graph'))
+            ])
+        ])
+
     return html.Div()  # Fallback por si acaso
 
+@app.callback(
+    Output('projection-graph', 'figure'),
+    Input('projection-method', 'value'),
+    Input('projection-color', 'value')
+)
+def update_projection(method, color_by):
+    return create_projection_figure(method, color_by)
+
+@app.callback(
+    Output('dependence-graph', 'figure'),
+    Input('dependence-model', 'value'),
+    Input('dependence-feature', 'value'),
+    Input('dependence-ice', 'value')
+)
+def update_dependence(model_key, feature, show_ice):
+    return create_dependence_figure(model_key, feature, 'ice' in show_ice)
+
+@app.callback(
+    Output('dependence-feature', 'options'),
+    Output('dependence-feature', 'value'),
+    Input('dependence-model', 'value')
+)
+def update_dependence_features(model_key):
+    # Variables ordenadas por importancia en el modelo seleccionado
+    features = ranked_features(model_key)
+    return [{'label': f, 'value': f} for f in features], features[0]
+
+@app.callback(
+    Output('correlation-graph', 'figure'),
+    Input('correlation-method', 'value'),
+    Input('correlation-clustered', 'value')
+)
+def update_correlation(method, clustered):
+    return create_correlation_figure(method, 'clustered' in clustered)
+
 if __name__ == '__main__':
     app.run_server(debug=True)